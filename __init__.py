@@ -67,29 +67,16 @@ class SCENE_OP_retarget_batcher(bpy.types.Operator):
 				self.report({'ERROR'}, f'Export path not specified.')
 				return {'CANCELLED'}
 
-		anim_entries = []
 		anim_crawler = AnimFileCrawler(os.path.join(bpy.context.scene.fix_synty_with_arp_import_path))
-		anim_crawler.crawl_folders_for_anims(anim_crawler.root_path, anim_entries)
+		anim_entries = anim_crawler.crawl_parallel()
 
 		ignore_root_motion = scene.fix_synty_with_arp_ignore_root_motion
 		anim_metadata_list = AnimFileEntryMetadataProcessor.load_metadata_list(anim_config_csv_path, ignore_root_motion)
 
-		# Find t-pose FBX file.
-		tpose_metadata: AnimFileEntryMetadata = None
-		for anim_metadata in anim_metadata_list:
-			if anim_metadata.tags == 'tpose':
-				tpose_metadata = anim_metadata
-				break
-
 		anim_metadata_organizer = AnimMetadataOrganizer()
 		anim_metadata_organizer.set_anim_metadata_list(anim_metadata_list)
 
-		for entry in anim_entries:
-			anim_entry: AnimFileEntry = entry
-			anim_metadata_entry = anim_metadata_organizer.try_find_anim_metadata_for_entry(anim_entry)
-			if anim_metadata_entry is not None:
-				anim_entry.should_loop = anim_metadata_entry.loop
-				anim_metadata_organizer.add_to_group(anim_metadata_entry.group, anim_entry)
+		anim_metadata_organizer.pair_with_file_entries(anim_entries)
 		
 		target_rig_name = scene.target_rig
 		target_rig = scene.objects.get(target_rig_name)
@@ -127,6 +114,21 @@ class SCENE_OP_retarget_batcher(bpy.types.Operator):
 			self.report({'ERROR'}, 'Auto-Rig Pro Remap bone map is not configured.')
 			return {'CANCELLED'}
 
+		self.retarget_and_export_groups(anim_metadata_organizer, target_rig)
+
+		# Known imports are removed per group; one sweep at the end picks up anything else they left behind
+		# (materials, images) without a full purge after every group.
+		print("Purge unused data...")
+		bpy.ops.outliner.orphans_purge(do_recursive=True)
+
+		self.report({'INFO'}, f'Exports finished.')
+		return {'FINISHED'}
+
+
+	def retarget_and_export_groups(self, anim_metadata_organizer: AnimMetadataOrganizer, target_rig) -> None:
+		scene = bpy.context.scene
+		export_path = scene.fix_synty_with_arp_export_path
+
 		for group in anim_metadata_organizer.get_group_names():
 			print('>>> Starting group: ' + group)
 
@@ -135,16 +137,25 @@ class SCENE_OP_retarget_batcher(bpy.types.Operator):
 			# Clear current NLA tracks, so that we only have the new NLA tracks we're importing for this set.
 			retarget_helpers.delete_all_nla_tracks_on_armature(target_rig)
 
-			for anim_file_entry in group_file_entries:
-				base_file_name = os.path.splitext(os.path.basename(anim_file_entry.full_path))[0]
-				anim_name = base_file_name
-				if anim_file_entry.should_loop and not anim_name.endswith('-loop'):
-					anim_name += '-loop'
-				retarget_helpers.push_fbx_animation_to_target_rig_nla_track(anim_file_entry.full_path, anim_name)
-				
+			# Imported source rigs are unlinked per clip and removed together once the group is done.
+			pending_removal = []
+
+			# Hide everything but the target rig once for the whole group; freshly imported source rigs stay visible.
+			saved_visibility = []
+			try:
+				retarget_helpers.hide_other_objects_in_viewport(scene, (target_rig,), saved_visibility)
+
+				for anim_file_entry in group_file_entries:
+					anim_name = anim_file_entry.base_stem
+					if anim_file_entry.should_loop and not anim_name.endswith('-loop'):
+						anim_name += '-loop'
+					retarget_helpers.push_fbx_animation_to_target_rig_nla_track(anim_file_entry.full_path, anim_name, target_rig, scene, pending_removal)
+			finally:
+				retarget_helpers.restore_viewport_visibility(saved_visibility)
+
 			# Remove unexpected characters to avoid unexpected hack attempts based on file name escape sequences.
 			sanitized_group_name = clean_group_name_to_be_filename(group)
-			full_export_path = os.path.join(bpy.context.scene.fix_synty_with_arp_export_path, sanitized_group_name + '.glb')
+			full_export_path = os.path.join(export_path, sanitized_group_name + '.glb')
 
 			bpy.ops.export_scene.gltf(
 				filepath=full_export_path,
@@ -152,13 +163,10 @@ class SCENE_OP_retarget_batcher(bpy.types.Operator):
 				export_animation_mode='NLA_TRACKS',
 				export_materials='NONE',
 				export_reset_pose_bones=True
-			) 
-			
-			print("Purge unused data...")
-			bpy.ops.outliner.orphans_purge()
+			)
 
-		self.report({'INFO'}, f'Exports finished.')
-		return {'FINISHED'}
+			print("Remove imported source data...")
+			bpy.data.batch_remove(ids=tuple(set(pending_removal)))
 
 
 class VIEW3D_PT_fix_synty_anim_to_godot_with_autorigpro(bpy.types.Panel):
@@ -14,13 +14,25 @@
 
 import bpy
 import os
+import re
+import sys
 
-from typing import List
+from typing import List, Dict
 
-from dataclasses import dataclass, asdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 import csv
 
 
+# Filename fragments used to guess whether an animation should loop. No-loop fragments take priority.
+_NOLOOP_RE = re.compile(r'(_to_|jump)')
+_LOOP_RE = re.compile(r'(walk|sprint|shuffle|turn|idle)')
+
+
+# Cell values accepted as true for boolean columns in the metadata CSV.
+_TRUE_STRS = frozenset({'TRUE', 'True', 'true', '1'})
+
+
 # For the line items in the metadata file.
 @dataclass
 class AnimFileEntryMetadata:
@@ -32,10 +44,13 @@ class AnimFileEntryMetadata:
 	orig_path: str
 
 
+@dataclass(slots=True)
 class AnimFileEntry:
 	full_path: str = ''
 	relative_path: str = ''
 	base_name: str = ''
+	base_stem: str = ''
+	base_name_lower: str = ''
 	should_loop: bool = False
 
 
@@ -56,55 +71,91 @@ class AnimFileCrawler:
 		self.filename_must_have = filename_must_have
 		self.filename_must_not_have = filename_must_not_have
 
+		# File extensions (lowercase) picked up by the crawl.
+		self._exts = ('.fbx',)
+
+		# Lowered once here, since they get compared against every file crawled.
+		self._must_have_l = filename_must_have.lower() if filename_must_have else None
+		self._must_not_have_l = filename_must_not_have.lower() if filename_must_not_have else None
+
 
 	def crawl_folders_for_anims(self, folder_path, out_entries):
-		path_contents = os.listdir(folder_path)
-		for filename in path_contents:
-			filename_lower = filename.lower()
-			
-			full_path = os.path.join(folder_path, filename)
-			if os.path.isdir(full_path):
-				self.crawl_folders_for_anims(full_path, out_entries)
-			elif filename_lower.endswith('.fbx'):
-				include = True
-				
-				if self.filename_must_have is not None:
-					if self.filename_must_have.lower() not in filename_lower:
-						include = False
-						
-				if self.filename_must_not_have is not None:
-					if self.filename_must_not_have.lower() in filename_lower:
-						include = False
-				
-				if include:
-					entry = AnimFileEntry()
-					entry.full_path = full_path
-					entry.relative_path = os.path.relpath(full_path, self.root_path)
-					entry.base_name = os.path.basename(full_path)
-					entry.should_loop = self.should_loop(full_path)
-					out_entries.append(entry)
-
-
-	def should_loop(self, filepath):
+		# Walk with an explicit stack instead of recursing, so deep trees don't cost a Python frame per folder.
+		# Keeping one open scandir iterator per level visits entries depth-first in listing order, same as recursing.
+		# scandir hands back the file type from the directory listing itself, avoiding a stat() per entry.
+		folder_stack = [os.scandir(folder_path)]
+		try:
+			while folder_stack:
+				dir_entry = next(folder_stack[-1], None)
+				if dir_entry is None:
+					folder_stack.pop().close()
+				elif dir_entry.is_dir():
+					folder_stack.append(os.scandir(dir_entry.path))
+				else:
+					self._try_add_file_entry(dir_entry, out_entries)
+		finally:
+			for dir_entries in folder_stack:
+				dir_entries.close()
+
+
+	def crawl_parallel(self, max_workers = 8) -> List[AnimFileEntry]:
+		# Crawling is I/O bound (and often on network drives), so fan the top-level folders out across threads.
+		# Results are merged back in directory listing order, so this matches crawl_folders_for_anims.
+		with os.scandir(self.root_path) as dir_entries:
+			dir_entries = list(dir_entries)
+
+		pending = []
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			for dir_entry in dir_entries:
+				if dir_entry.is_dir():
+					pending.append(executor.submit(self._crawl_collect, dir_entry.path))
+				else:
+					root_file_entries = []
+					self._try_add_file_entry(dir_entry, root_file_entries)
+					pending.append(root_file_entries)
+
+			out_entries = []
+			for result in pending:
+				if isinstance(result, Future):
+					out_entries.extend(result.result())
+				else:
+					out_entries.extend(result)
+
+		return out_entries
+
+
+	def _crawl_collect(self, folder_path) -> List[AnimFileEntry]:
+		out_entries = []
+		self.crawl_folders_for_anims(folder_path, out_entries)
+		return out_entries
+
+
+	def _try_add_file_entry(self, dir_entry, out_entries):
+		filename = dir_entry.name
+		filename_lower = filename.lower()
+		if (
+			not filename_lower.endswith(self._exts)
+			or (self._must_have_l and self._must_have_l not in filename_lower)
+			or (self._must_not_have_l and self._must_not_have_l in filename_lower)
+		):
+			return
+
+		full_path = dir_entry.path
+		entry = AnimFileEntry()
+		entry.full_path = full_path
+		entry.relative_path = os.path.relpath(full_path, self.root_path)
+		entry.base_name = filename
+		entry.base_name_lower = filename_lower
+		entry.base_stem = os.path.splitext(filename)[0]
+		entry.should_loop = self.should_loop(filename_lower)
+		out_entries.append(entry)
+
+
+	def should_loop(self, basename_lower):
 		# TODO: Add way to specify rule list or overrides...
-		basename = os.path.basename(filepath).lower()
-		if '_to_' in basename:
+		if _NOLOOP_RE.search(basename_lower):
 			return False
-		if 'jump' in basename:
-			return False
-
-		if 'walk' in basename:
-			return True
-		if 'sprint' in basename:
-			return True
-		if 'shuffle' in basename:
-			return True
-		if 'turn' in basename:
-			return True
-		if 'idle' in basename:
-			return True
-		
-		return False
+		return _LOOP_RE.search(basename_lower) is not None
 
 
 # Reads and writes CSV files for animation data metadata.
@@ -114,18 +165,42 @@ class AnimFileEntryMetadataProcessor:
 		list: List[AnimFileEntryMetadata] = []
 		
 		with open(csv_filename, 'r') as in_file:
-			csv_reader = csv.DictReader(in_file)
+			csv_reader = csv.reader(in_file)
+
+			# Resolve column positions once from the header rather than building a dict per row.
+			header = next(csv_reader, None)
+			if header is None:
+				return list
+			filename_idx = header.index('filename')
+			group_idx = header.index('group')
+			loop_idx = header.index('loop')
+			root_motion_idx = header.index('root_motion')
+			tags_idx = header.index('tags')
+			orig_path_idx = header.index('orig_path')
+			row_len = max(filename_idx, group_idx, loop_idx, root_motion_idx, tags_idx, orig_path_idx) + 1
+
 			for row in csv_reader:
-				metadata = AnimFileEntryMetadata(
-					filename=row['filename'],
-					group=row['group'],
-					loop=row['loop'] == 'TRUE',
-					root_motion=row['root_motion'] == 'TRUE',
-					tags=row['tags'],
-					orig_path=row['orig_path']
-				)
-				if not ignore_root_motion or not metadata.root_motion:
-					list.append(metadata)
+				# DictReader used to skip blank lines for us.
+				if not row:
+					continue
+
+				# Hand-edited rows may drop trailing empty cells; pad them rather than failing the whole load.
+				if len(row) < row_len:
+					row += [''] * (row_len - len(row))
+
+				root_motion = row[root_motion_idx] in _TRUE_STRS
+				if ignore_root_motion and root_motion:
+					continue
+
+				list.append(AnimFileEntryMetadata(
+					filename=row[filename_idx],
+					# Groups and tags repeat across many rows, so share one string object for each.
+					group=sys.intern(row[group_idx]),
+					loop=row[loop_idx] in _TRUE_STRS,
+					root_motion=root_motion,
+					tags=sys.intern(row[tags_idx]),
+					orig_path=row[orig_path_idx]
+				))
 
 		return list
 	
@@ -133,10 +208,19 @@ class AnimFileEntryMetadataProcessor:
 	def save_metadata_list(csv_filename: str, entry_list: List[AnimFileEntryMetadata]) -> None:
 		with open(csv_filename, 'w', newline='') as out_file:
 			fieldnames = ['filename', 'group', 'loop', 'root_motion', 'tags', 'orig_path']
-			csv_writer = csv.DictWriter(out_file, fieldnames=fieldnames)
-			csv_writer.writeheader()
-			for entry in entry_list:
-				csv_writer.writerow(asdict(entry))
+			csv_writer = csv.writer(out_file)
+			csv_writer.writerow(fieldnames)
+			csv_writer.writerows(
+				(
+					entry.filename,
+					entry.group,
+					'TRUE' if entry.loop else 'FALSE',
+					'TRUE' if entry.root_motion else 'FALSE',
+					entry.tags,
+					entry.orig_path
+				)
+				for entry in entry_list
+			)
 
 	@staticmethod
 	def build_metadata_list_template_from_folder(root_path: str) -> List[AnimFileEntryMetadata]:
@@ -159,9 +243,10 @@ class AnimFileEntryMetadataProcessor:
 
 
 
+@dataclass(slots=True)
 class AnimMetadataGroup:
 	group: str
-	entries: List[AnimFileEntry]
+	entries: List[AnimFileEntry] = field(default_factory=list)
 
 # Organizes and groups the animation metadata and pairs with actual files found.
 class AnimMetadataOrganizer:
@@ -173,6 +258,7 @@ class AnimMetadataOrganizer:
 
 	def __init__(self):
 		self._group_map = {}
+		self._anim_metadata_list = []
 
 
 	def set_anim_metadata_list(self, anim_metadata_list: List[AnimFileEntryMetadata]) -> None:
@@ -188,27 +274,32 @@ class AnimMetadataOrganizer:
 		self._tpose_metadata = tpose_metadata
 
 
-	def try_find_anim_metadata_for_entry(self, anim_entry: AnimFileEntry) -> AnimFileEntryMetadata:
-		for metadata in self._anim_metadata_list:
-			if metadata.filename == anim_entry.base_name:
-				return metadata
-			
-		return None
-	
+	def pair_with_file_entries(self, anim_entries: List[AnimFileEntry]) -> None:
+		# Walk the metadata once and probe the crawled files by name. Rows for files that aren't on disk
+		# (partial installs) just fall through.
+		anim_entries_by_name: Dict[str, List[AnimFileEntry]] = {}
+		for anim_entry in anim_entries:
+			anim_entries_by_name.setdefault(anim_entry.base_name, []).append(anim_entry)
+
+		for anim_metadata_entry in self._anim_metadata_list:
+			# Popped so that only the first metadata row for a filename is used.
+			matching_anim_entries = anim_entries_by_name.pop(anim_metadata_entry.filename, None)
+			if matching_anim_entries is None:
+				continue
+			for anim_entry in matching_anim_entries:
+				anim_entry.should_loop = anim_metadata_entry.loop
+				self.add_to_group(anim_metadata_entry.group, anim_metadata_entry, anim_entry)
+
 
-	def add_to_group(self, group: str, anim_entry: AnimFileEntry) -> None:
+	def add_to_group(self, group: str, metadata_entry: AnimFileEntryMetadata, anim_entry: AnimFileEntry) -> None:
 		metadata_group: AnimMetadataGroup = self._group_map.get(group)
 		if metadata_group is None:
-			metadata_group = AnimMetadataGroup()
-			metadata_group.group = group
-			metadata_group.entries = []
+			metadata_group = AnimMetadataGroup(group)
 			self._group_map[group] = metadata_group
 
 		# If we still need the tpose, see if this is the file for that one.
-		if self._tpose_file_entry is None:
-			metadata_entry = self.try_find_anim_metadata_for_entry(anim_entry)
-			if metadata_entry == self._tpose_metadata:
-				self._tpose_file_entry = anim_entry
+		if self._tpose_file_entry is None and metadata_entry is self._tpose_metadata:
+			self._tpose_file_entry = anim_entry
 
 		metadata_group.entries.append(anim_entry)
 
@@ -15,12 +15,17 @@
 import bpy
 
 
-def delete_blender_obj(obj):
-	for collection in list(obj.users_collection):
-		collection.objects.unlink(obj)
-	if obj.users == 0:
-		bpy.data.objects.remove(obj)
-	del obj
+def unlink_blender_objs_for_batch_removal(objs, pending_removal):
+	# Take the objects out of the scene now, but leave the actual datablock removal (objects, their data
+	# and actions) to a single bpy.data.batch_remove call later.
+	for obj in objs:
+		for collection in list(obj.users_collection):
+			collection.objects.unlink(obj)
+		pending_removal.append(obj)
+		if obj.data is not None:
+			pending_removal.append(obj.data)
+		if obj.animation_data is not None and obj.animation_data.action is not None:
+			pending_removal.append(obj.animation_data.action)
 
 
 def clear_animation_action_on_armature(armature):
@@ -28,14 +33,14 @@ def clear_animation_action_on_armature(armature):
 	
 
 def delete_all_nla_tracks_on_armature(armature):
-	armature.animation_data.nla_tracks
+	animation_data = armature.animation_data
+	if animation_data is None:
+		return
 
-	track_list = []
-	for track in armature.animation_data.nla_tracks:
-		track_list.append(track)
-		
-	for track in track_list:
-		armature.animation_data.nla_tracks.remove(track)
+	# Remove tracks in place, without building a temporary list of them first.
+	nla_tracks = animation_data.nla_tracks
+	while len(nla_tracks):
+		nla_tracks.remove(nla_tracks[len(nla_tracks) - 1])
 
 
 def push_armature_action_to_new_nla_strip(armature, frame_from, track_name, strip_name):
@@ -53,28 +58,50 @@ def push_armature_action_to_new_nla_strip(armature, frame_from, track_name, stri
 			clear_animation_action_on_armature(armature)
 			
 
-def push_fbx_animation_to_target_rig_nla_track(fbx_abs_path, anim_name):
-	scene = bpy.context.scene
-	
+def hide_other_objects_in_viewport(scene, visible_objects, saved_visibility):
+	# Hidden objects are left out of depsgraph evaluation, so ARP ops only pay for the rigs they work on.
+	# A throwaway scene holding just the two rigs would do the same, but ARP keeps its source/target rig
+	# and bone map settings on the scene itself, so the retarget has to run in the user's scene.
+	# Each object is recorded before it is touched, so the caller can restore even if this fails partway.
+	for obj in scene.objects:
+		# Linked objects have read-only visibility.
+		if obj in visible_objects or obj.library is not None:
+			continue
+		saved_visibility.append((obj, obj.hide_viewport))
+		obj.hide_viewport = True
+
+
+def restore_viewport_visibility(saved_visibility):
+	for obj, hide_viewport in saved_visibility:
+		obj.hide_viewport = hide_viewport
+
+
+def push_fbx_animation_to_target_rig_nla_track(fbx_abs_path, anim_name, target_rig, scene, pending_removal):
+	objects_before_import = set(bpy.data.objects)
+
 	bpy.ops.import_scene.fbx(
 		filepath = fbx_abs_path, 
 		automatic_bone_orientation = True,
 		ignore_leaf_bones = True, 
 		anim_offset = 0)
+
+	# Remember exactly what this import created, so only that gets removed afterwards.
+	imported_objects = [obj for obj in bpy.data.objects if obj not in objects_before_import]
 		
 	# Update ARP's source rig.
-	scene.source_rig = bpy.context.active_object.name
+	source_rig = bpy.context.active_object
+	scene.source_rig = source_rig.name
 	
 	# Clear current action on target armature.
-	target_rig_name = scene.target_rig
-	target_rig = scene.objects[target_rig_name]
-
 	target_rig.animation_data.action = None
 
 	###
 	### Reset the base pose on source armature.
 	###
 
+	# These ops edit the rest pose of the freshly imported source armature itself, so they have to run
+	# for every clip even when every file in the batch shares the same skeleton.
+
 	# Press Redefine Rest Pose equivalent
 	bpy.ops.arp.redefine_rest_pose(rest_pose='REST', preserve=False, is_arp_armature=False)
 
@@ -93,9 +120,6 @@ def push_fbx_animation_to_target_rig_nla_track(fbx_abs_path, anim_name):
 	###
 
 	# Press Re-Target equivalent.
-	source_rig_name = scene.source_rig
-	source_rig = scene.objects[source_rig_name]
-
 	frame_range = source_rig.animation_data.action.frame_range
 	frame_start = int(frame_range[0])
 	frame_end = int(frame_range[1])
@@ -105,4 +129,4 @@ def push_fbx_animation_to_target_rig_nla_track(fbx_abs_path, anim_name):
 	# Push animation down to the NLA strip on the target rig.
 	push_armature_action_to_new_nla_strip(target_rig, frame_start, anim_name, anim_name)
 
-	delete_blender_obj(source_rig)
\ No newline at end of file
+	unlink_blender_objs_for_batch_removal(imported_objects, pending_removal)